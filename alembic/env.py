@@ -1,3 +1,4 @@
+import re
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -5,6 +6,7 @@ from sqlalchemy import pool
 
 from alembic import context
 from app.models.user_model import Base  # adjust "myapp.models" to the actual location of your Base
+import app.models.audit_log_model  # noqa: F401  registers audit_logs and audit_actions on Base.metadata
 
 
 # this is the Alembic Config object, which provides
@@ -22,6 +24,18 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# audit_logs partitions are created by the migrations and app.services.audit_log_partitions,
+# not declared on the models, so autogenerate must not offer to drop them
+_AUDIT_LOG_PARTITION = re.compile(r"^audit_logs_(default|y\d{4}m\d{2})$")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and reflected and _AUDIT_LOG_PARTITION.match(name):
+        return False
+    if type_ == "index" and reflected and _AUDIT_LOG_PARTITION.match(object.table.name):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -45,6 +59,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -67,7 +82,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
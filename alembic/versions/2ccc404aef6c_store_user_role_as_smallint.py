@@ -0,0 +1,34 @@
+"""store user role as smallint
+
+Revision ID: 2ccc404aef6c
+Revises: 25d814bc83ed
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ccc404aef6c'
+down_revision: Union[str, None] = '25d814bc83ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.user_model.ROLE_CODES
+ROLE_CODES = {"ANONYMOUS": 0, "AUTHENTICATED": 1, "MANAGER": 2, "ADMIN": 3, "PENDING": 4}
+
+
+def upgrade() -> None:
+    to_code = " ".join(f"WHEN '{name}' THEN {code}" for name, code in ROLE_CODES.items())
+    op.execute(f"ALTER TABLE users ALTER COLUMN role TYPE smallint USING (CASE role::text {to_code} END)")
+    op.execute('DROP TYPE IF EXISTS "UserRole"')
+
+
+def downgrade() -> None:
+    names = ", ".join(f"'{name}'" for name in ROLE_CODES)
+    to_name = " ".join(f"WHEN {code} THEN '{name}'" for name, code in ROLE_CODES.items())
+    op.execute(f'CREATE TYPE "UserRole" AS ENUM ({names})')
+    op.execute(f'ALTER TABLE users ALTER COLUMN role TYPE "UserRole" USING (CASE role {to_name} END)::"UserRole"')
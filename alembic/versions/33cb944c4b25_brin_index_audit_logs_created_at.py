@@ -0,0 +1,26 @@
+"""brin index audit logs created_at
+
+Revision ID: 33cb944c4b25
+Revises: cc59a4c40cd0
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '33cb944c4b25'
+down_revision: Union[str, None] = 'cc59a4c40cd0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX ix_audit_logs_created_brin ON audit_logs USING BRIN (created_at) WITH (pages_per_range = 32)")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_created_brin', table_name='audit_logs')
@@ -0,0 +1,73 @@
+"""add audit_logs table
+
+Revision ID: 5746a8f7c272
+Revises: 7f3a91c2d4e8
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5746a8f7c272'
+down_revision: Union[str, None] = '7f3a91c2d4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_unpartitioned_audit_logs() -> bool:
+    """True when Base.metadata.create_all() already made a plain audit_logs table outside this chain."""
+    return op.get_bind().execute(sa.text("SELECT to_regclass('audit_logs') IS NOT NULL")).scalar()
+
+
+def _create_month_partitions(source: str) -> None:
+    """Create a monthly partition for every month holding rows in source, so none end up in the default partition."""
+    months = op.get_bind().execute(sa.text(
+        f"SELECT DISTINCT date_trunc('month', COALESCE(created_at, now()) AT TIME ZONE 'UTC')::date FROM {source}"
+    )).scalars()
+    for month in months:
+        next_month = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+        # Named like app.services.audit_log_partitions, which then treats these months as done
+        op.execute(
+            f"CREATE TABLE audit_logs_y{month:%Y}m{month:%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month} 00:00:00+00') TO ('{next_month} 00:00:00+00')"
+        )
+
+
+def upgrade() -> None:
+    convert = _has_unpartitioned_audit_logs()
+    if convert:
+        # A table cannot be partitioned in place, so move it aside and copy its rows into the partitioned table below
+        op.rename_table('audit_logs', 'audit_logs_unpartitioned')
+        op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+    # Partitioned by month so old months can be archived with DETACH PARTITION;
+    # the partition key has to be part of the primary key
+    op.create_table('audit_logs',
+    # The application always supplies time-ordered UUIDv7 ids (app.utils.uuid_gen);
+    # gen_random_uuid() only covers rows inserted by hand
+    sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('action', sa.String(length=100), nullable=False),
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('performed_by', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    # Catch-all for rows outside every monthly partition
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    if convert:
+        _create_month_partitions('audit_logs_unpartitioned')
+        op.execute(
+            "INSERT INTO audit_logs (id, action, user_id, performed_by, created_at) "
+            "SELECT id, action, user_id, performed_by, COALESCE(created_at, now()) FROM audit_logs_unpartitioned"
+        )
+        op.drop_table('audit_logs_unpartitioned')
+
+
+def downgrade() -> None:
+    op.drop_table('audit_logs')
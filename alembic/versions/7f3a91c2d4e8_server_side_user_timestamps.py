@@ -0,0 +1,44 @@
+"""server side user timestamps
+
+Revision ID: 7f3a91c2d4e8
+Revises: 2ccc404aef6c
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a91c2d4e8'
+down_revision: Union[str, None] = '2ccc404aef6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE users SET created_at = now() WHERE created_at IS NULL")
+    op.execute("UPDATE users SET updated_at = created_at WHERE updated_at IS NULL")
+    op.alter_column('users', 'created_at', server_default=sa.text('now()'), nullable=False)
+    op.alter_column('users', 'updated_at', server_default=sa.text('now()'), nullable=False)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION now_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER users_touch_updated_at BEFORE UPDATE ON users "
+        "FOR EACH ROW EXECUTE FUNCTION now_updated_at()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS users_touch_updated_at ON users")
+    op.execute("DROP FUNCTION IF EXISTS now_updated_at()")
+    op.alter_column('users', 'updated_at', nullable=True)
+    op.alter_column('users', 'created_at', nullable=True)
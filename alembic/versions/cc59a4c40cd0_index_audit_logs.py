@@ -0,0 +1,31 @@
+"""index audit logs
+
+Revision ID: cc59a4c40cd0
+Revises: 5746a8f7c272
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cc59a4c40cd0'
+down_revision: Union[str, None] = '5746a8f7c272'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_audit_logs_user_created', 'audit_logs', ['user_id', sa.text('created_at DESC')])
+    op.create_index('ix_audit_logs_performed_by', 'audit_logs', ['performed_by'])
+    # Lookups by email and nickname rely on the unique indexes from the initial migration
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_nickname ON users (nickname)")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_performed_by', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_user_created', table_name='audit_logs')
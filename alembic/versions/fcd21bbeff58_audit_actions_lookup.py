@@ -0,0 +1,78 @@
+"""audit actions lookup
+
+Revision ID: fcd21bbeff58
+Revises: 33cb944c4b25
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fcd21bbeff58'
+down_revision: Union[str, None] = '33cb944c4b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.audit_log_model.AuditActionCode
+AUDIT_ACTIONS = {
+    "CHANGE_ROLE": 1, "CREATE_USER": 2, "UPDATE_PROFILE": 3, "DELETE_USER": 4, "LOGIN": 5,
+    "LOGIN_FAILED": 6, "LOCK_ACCOUNT": 7, "UNLOCK_ACCOUNT": 8, "VERIFY_EMAIL": 9, "RESET_PASSWORD": 10,
+}
+
+
+def upgrade() -> None:
+    audit_actions = op.create_table('audit_actions',
+    sa.Column('id', sa.SmallInteger(), nullable=False),
+    sa.Column('name', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.bulk_insert(audit_actions, [{'id': code, 'name': name} for name, code in AUDIT_ACTIONS.items()])
+    # The smallint primary key is created as SMALLSERIAL; free-text actions that are not in the
+    # seed list get ids after the seeded ones
+    op.execute(f"SELECT setval(pg_get_serial_sequence('audit_actions', 'id'), {max(AUDIT_ACTIONS.values())})")
+
+    op.add_column('audit_logs', sa.Column('action_id', sa.SmallInteger(), nullable=True))
+    op.add_column('audit_logs', sa.Column('detail', postgresql.JSONB(), nullable=True))
+    op.execute(f"""
+        UPDATE audit_logs
+        SET action_id = {AUDIT_ACTIONS['CHANGE_ROLE']},
+            detail = jsonb_build_object('role', substring(action FROM 'Changed role to (.*)'))
+        WHERE action LIKE 'Changed role to %'
+    """)
+    op.execute("""
+        INSERT INTO audit_actions (name)
+        SELECT DISTINCT action FROM audit_logs WHERE action_id IS NULL
+        ON CONFLICT (name) DO NOTHING
+    """)
+    op.execute("""
+        UPDATE audit_logs SET action_id = audit_actions.id
+        FROM audit_actions
+        WHERE audit_logs.action_id IS NULL AND audit_actions.name = audit_logs.action
+    """)
+    op.alter_column('audit_logs', 'action_id', nullable=False)
+    op.create_foreign_key('audit_logs_action_id_fkey', 'audit_logs', 'audit_actions', ['action_id'], ['id'])
+    op.drop_column('audit_logs', 'action')
+
+
+def downgrade() -> None:
+    op.add_column('audit_logs', sa.Column('action', sa.String(length=100), nullable=True))
+    op.execute("""
+        UPDATE audit_logs SET action = CASE
+            WHEN audit_actions.name = 'CHANGE_ROLE' AND audit_logs.detail ? 'role'
+                THEN 'Changed role to ' || (audit_logs.detail ->> 'role')
+            ELSE audit_actions.name
+        END
+        FROM audit_actions
+        WHERE audit_actions.id = audit_logs.action_id
+    """)
+    op.alter_column('audit_logs', 'action', nullable=False)
+    op.drop_constraint('audit_logs_action_id_fkey', 'audit_logs', type_='foreignkey')
+    op.drop_column('audit_logs', 'detail')
+    op.drop_column('audit_logs', 'action_id')
+    op.drop_table('audit_actions')
@@ -1,21 +1,45 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import declarative_base, sessionmaker
+import asyncio
+import logging
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_scoped_session, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+logger = logging.getLogger(__name__)
 
 class Database:
     """Handles database connections and sessions."""
     _engine = None
     _session_factory = None
+    _scoped_session = None
+    _cache_hits = 0
+    _cache_misses = 0
 
     @classmethod
-    def initialize(cls, database_url: str, echo: bool = False):
-        """Initialize the async engine and sessionmaker."""
+    def initialize(cls, database_url: str, echo: bool = False, pool_size: int = 20, max_overflow: int = 10,
+                   query_cache_size: int = 1200, track_cache_stats: bool = False):
+        """
+        Initialize the pooled async engine, the sessionmaker and the task-scoped session registry.
+        Compiled-cache statistics cost a Python call per statement, so they are only counted
+        when track_cache_stats is set.
+        """
         if cls._engine is None:  # Ensure engine is created once
-            cls._engine = create_async_engine(database_url, echo=echo, future=True)
-            cls._session_factory = sessionmaker(
-                bind=cls._engine, class_=AsyncSession, expire_on_commit=False, future=True
+            cls._engine = create_async_engine(
+                database_url,
+                echo=echo,
+                future=True,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,  # Drop connections the server closed while idle
+                pool_recycle=3600,  # Reconnect hourly instead of reusing stale connections forever
+                query_cache_size=query_cache_size,  # Compiled SQL is reused across requests for identical statements
             )
+            cls._session_factory = async_sessionmaker(
+                bind=cls._engine, class_=AsyncSession, expire_on_commit=False
+            )
+            cls._scoped_session = async_scoped_session(cls._session_factory, scopefunc=asyncio.current_task)
+            if track_cache_stats:
+                event.listen(cls._engine.sync_engine, "before_cursor_execute", cls._count_cache_use)
 
     @classmethod
     def get_session_factory(cls):
@@ -23,3 +47,42 @@ class Database:
         if cls._session_factory is None:
             raise ValueError("Database not initialized. Call `initialize()` first.")
         return cls._session_factory
+
+    @classmethod
+    def get_scoped_session(cls):
+        """Returns the session bound to the current asyncio task, ensuring it's initialized."""
+        if cls._scoped_session is None:
+            raise ValueError("Database not initialized. Call `initialize()` first.")
+        return cls._scoped_session()
+
+    @classmethod
+    async def remove_scoped_session(cls):
+        """Closes the current task's session and returns its connection to the pool."""
+        if cls._scoped_session is not None:
+            await cls._scoped_session.remove()
+
+    @classmethod
+    async def dispose(cls):
+        """Closes every pooled connection; the engine opens fresh ones on next use."""
+        if cls._engine is not None:
+            await cls._engine.dispose()
+
+    @classmethod
+    def _count_cache_use(cls, conn, cursor, statement, parameters, context, executemany):
+        if context is None or context.compiled is None:
+            return  # Raw driver SQL (exec_driver_sql) is never compiled
+        if context.cache_hit == context.dialect.CACHE_HIT:
+            cls._cache_hits += 1
+        else:
+            cls._cache_misses += 1
+
+    @classmethod
+    def log_compiled_cache_stats(cls):
+        """Logs the SQL compilation cache hit ratio over the statements counted so far, if any were."""
+        total = cls._cache_hits + cls._cache_misses
+        if total == 0:
+            return
+        logger.info(
+            f"SQL compilation cache: {cls._cache_hits} hits, {cls._cache_misses} misses "
+            f"({cls._cache_hits / total:.1%} hit ratio)."
+        )
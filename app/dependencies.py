@@ -1,4 +1,6 @@
-from builtins import Exception, dict, str
+from builtins import Exception, dict, frozenset, isinstance, str
+from functools import lru_cache
+from typing import Tuple
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,13 +20,17 @@ def get_email_service() -> EmailService:
     return EmailService(template_manager=template_manager)
 
 async def get_db() -> AsyncSession:
-    """Dependency that provides a database session for each request."""
-    async_session_factory = Database.get_session_factory()
-    async with async_session_factory() as session:
-        try:
-            yield session
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    """Dependency that provides the task-scoped database session for the current request."""
+    session = Database.get_scoped_session()
+    try:
+        yield session
+    except HTTPException:
+        raise  # Endpoint errors such as 404 reach the client unchanged
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await Database.remove_scoped_session()
         
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
@@ -44,9 +50,13 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
         raise credentials_exception
     return {"user_id": user_id, "role": user_role}
 
-def require_role(role: str):
+@lru_cache(maxsize=32)
+def require_role(roles: Tuple[str, ...]):
+    """Return the (cached) dependency that only lets users with one of the given roles through."""
+    allowed_roles = frozenset((roles,) if isinstance(roles, str) else roles)
+
     def role_checker(current_user: dict = Depends(get_current_user)):
-        if current_user["role"] not in role:
+        if current_user["role"] not in allowed_roles:
             raise HTTPException(status_code=403, detail="Operation not permitted")
         return current_user
     return role_checker
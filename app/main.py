@@ -1,11 +1,14 @@
 from builtins import Exception
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware  # Import the CORSMiddleware
 from app.database import Database
 from app.dependencies import get_settings
 from app.routers import user_routes
+from app.services import audit_log_partitions, audit_log_writer
 from app.utils.api_description import getDescription
+from app.utils.link_generation import compile_user_link_templates
 app = FastAPI(
     title="User Management",
     description=getDescription(),
@@ -16,6 +19,7 @@ app = FastAPI(
         "email": "support@example.com",
     },
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
+    default_response_class=ORJSONResponse,
 )
 # CORS middleware configuration
 # This middleware will enable CORS and allow requests from any origin
@@ -31,7 +35,17 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     settings = get_settings()
-    Database.initialize(settings.database_url, settings.debug)
+    Database.initialize(settings.database_url, settings.debug, track_cache_stats=settings.debug)
+    compile_user_link_templates(app.routes)
+    await audit_log_partitions.ensure_partitions()  # Fail startup loudly rather than run without partitions
+    audit_log_partitions.start()
+    audit_log_writer.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await audit_log_writer.stop()
+    await audit_log_partitions.stop()
+    Database.log_compiled_cache_stats()
 
 @app.exception_handler(Exception)
 async def exception_handler(request, exc):
@@ -1,29 +0,0 @@
-"""add audit_logs table
-
-Revision ID: 1234567890ab
-Revises: <previous_revision_id>
-Create Date: 2025-04-20 23:00:00
-"""
-
-from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
-revision = '1234567890ab'
-down_revision = '<previous_revision_id>'
-branch_labels = None
-depends_on = None
-
-def upgrade():
-    op.create_table(
-        'audit_logs',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text('gen_random_uuid()')),
-        sa.Column('action', sa.String(length=100), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('performed_by', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
-        sa.PrimaryKeyConstraint('id')
-    )
-
-def downgrade():
-    op.drop_table('audit_logs')
\ No newline at end of file
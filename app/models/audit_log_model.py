@@ -1,16 +1,62 @@
-from sqlalchemy import Column, String, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from enum import IntEnum
+from typing import Optional
+from sqlalchemy import Column, DateTime, ForeignKey, Index, SmallInteger, Text, DDL, event, func, insert, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.database import Base
-from datetime import datetime
-from uuid import uuid4, UUID as UUIDType
-import pytz
+from datetime import datetime, timezone
+from uuid import UUID as UUIDType
+from app.utils.uuid_gen import uuid7
+
+class AuditActionCode(IntEnum):
+    """Ids of the rows seeded into audit_actions; never renumber, only append."""
+    CHANGE_ROLE = 1
+    CREATE_USER = 2
+    UPDATE_PROFILE = 3
+    DELETE_USER = 4
+    LOGIN = 5
+    LOGIN_FAILED = 6
+    LOCK_ACCOUNT = 7
+    UNLOCK_ACCOUNT = 8
+    VERIFY_EMAIL = 9
+    RESET_PASSWORD = 10
+
+class AuditAction(Base):
+    __tablename__ = "audit_actions"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
-    
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    action: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Monthly RANGE partitions; created daily by app.services.audit_log_partitions
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
+
+    # Time-ordered ids keep inserts on the rightmost leaf of the primary key index
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    action_id: Mapped[int] = mapped_column(SmallInteger, ForeignKey("audit_actions.id"), nullable=False)
+    # Action specifics that used to be spelled out in the action text, e.g. {"role": "ADMIN"}
+    detail: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     user_id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), nullable=False)
     performed_by: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(pytz.UTC))
\ No newline at end of file
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(timezone.utc), server_default=func.now())
+
+@event.listens_for(AuditAction.__table__, "after_create")
+def _seed_audit_actions(target, connection, **kw):
+    connection.execute(insert(target), [{"id": code.value, "name": code.name} for code in AuditActionCode])
+    if connection.dialect.name == "postgresql":
+        # Explicit ids bypass the SMALLSERIAL sequence; move it past them like the Alembic revision does
+        connection.execute(select(func.setval(func.pg_get_serial_sequence(target.name, "id"), max(AuditActionCode))))
+
+# Per-user audit timelines read newest first; admins look up their own actions by performed_by
+Index("ix_audit_logs_user_created", AuditLog.user_id, AuditLog.created_at.desc())
+Index("ix_audit_logs_performed_by", AuditLog.performed_by)
+# audit_logs is append-only, so a tiny BRIN index is enough for time-window scans
+Index("ix_audit_logs_created_brin", AuditLog.created_at, postgresql_using="brin", postgresql_with={"pages_per_range": 32})
+
+# Catch-all partition so rows are never rejected when a month's partition is missing
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT").execute_if(dialect="postgresql"),
+)
@@ -1,12 +1,42 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Enum, Integer
+from sqlalchemy import Column, Row, String, DateTime, Boolean, Integer, SmallInteger, DDL, FetchedValue, case, event, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 from app.database import Base
-from datetime import datetime
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Optional
 from uuid import uuid4, UUID as UUIDType
-from app.models.user_role import UserRole
-from app.core.security import hash_password
-import pytz
+
+class UserRole(Enum):
+    """Enumeration of user roles within the application."""
+    ANONYMOUS = "ANONYMOUS"
+    AUTHENTICATED = "AUTHENTICATED"
+    MANAGER = "MANAGER"
+    ADMIN = "ADMIN"
+    PENDING = "PENDING"
+
+# Stable on-disk codes for each role; never renumber, only append
+ROLE_CODES = {"ANONYMOUS": 0, "AUTHENTICATED": 1, "MANAGER": 2, "ADMIN": 3, "PENDING": 4}
+
+class RoleType(TypeDecorator):
+    """Stores a UserRole as a SMALLINT code instead of a PostgreSQL enum."""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        role = value if isinstance(value, UserRole) else UserRole[value]
+        return ROLE_CODES[role.name]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _ROLES_BY_CODE[value]
+
+_ROLES_BY_CODE = {code: UserRole[name] for name, code in ROLE_CODES.items() if name in UserRole.__members__}
 
 class User(Base):
     __tablename__ = "users"
@@ -21,44 +51,69 @@ class User(Base):
     profile_picture_url: Mapped[str] = mapped_column(String(255), nullable=True)
     github_profile_url: Mapped[str] = mapped_column(String(255), nullable=True)
     linkedin_profile_url: Mapped[str] = mapped_column(String(255), nullable=True)
-    role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.PENDING, nullable=False)
+    role: Mapped[UserRole] = mapped_column(RoleType, default=UserRole.PENDING, nullable=False)
     email_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_professional: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_locked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     failed_login_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_login_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     verification_token: Mapped[str] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(pytz.UTC))
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(pytz.UTC), onupdate=lambda: datetime.now(pytz.UTC))
+    # Both timestamps are set by PostgreSQL: server defaults on INSERT, the users_touch_updated_at trigger on UPDATE
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), nullable=False)
+
+    # Read server-generated timestamps back through RETURNING instead of lazy-loading them later
+    __mapper_args__ = {"eager_defaults": True}
 
     def update_professional_status(self, is_professional: bool) -> None:
         """Update the user's professional status."""
         self.is_professional = is_professional
-        self.updated_at = datetime.now(pytz.UTC)
     
     def lock_account(self) -> None:
         """Lock the user account due to too many failed login attempts."""
         self.is_locked = True
-        self.updated_at = datetime.now(pytz.UTC)
     
-    def increment_failed_login_attempts(self) -> None:
-        """Increment the failed login attempts counter."""
-        self.failed_login_attempts += 1
-        self.updated_at = datetime.now(pytz.UTC)
+    @classmethod
+    async def increment_failed(cls, session: AsyncSession, user_id: UUIDType, threshold: int = 5) -> Row:
+        """
+        Atomically count a failed login and lock the account once the threshold is reached.
+        Returns the new (failed_login_attempts, is_locked); the caller commits.
+        """
+        attempts = cls.failed_login_attempts + 1
+        stmt = (
+            update(cls)
+            .where(cls.id == user_id)
+            .values(failed_login_attempts=attempts, is_locked=case((attempts >= threshold, True), else_=cls.is_locked))
+            .returning(cls.failed_login_attempts, cls.is_locked)
+        )
+        return (await session.execute(stmt)).one()
     
     def reset_failed_login_attempts(self) -> None:
         """Reset the failed login attempts counter."""
         self.failed_login_attempts = 0
-        self.updated_at = datetime.now(pytz.UTC)
     
-    def update_last_login(self) -> None:
+    def update_last_login(self, now: Optional[datetime] = None) -> None:
         """Update the last login timestamp."""
-        self.last_login_at = datetime.now(pytz.UTC)
-        self.updated_at = datetime.now(pytz.UTC)
+        self.last_login_at = now or datetime.now(timezone.utc)
     
     def verify_email(self) -> None:
         """Mark the user's email as verified."""
         self.email_verified = True
         self.role = UserRole.AUTHENTICATED
         self.verification_token = None
-        self.updated_at = datetime.now(pytz.UTC)
\ No newline at end of file
+
+# Keep updated_at current on every UPDATE; also installed by the matching Alembic revision
+TOUCH_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION now_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+TOUCH_UPDATED_AT_TRIGGER = (
+    "CREATE TRIGGER users_touch_updated_at BEFORE UPDATE ON users "
+    "FOR EACH ROW EXECUTE FUNCTION now_updated_at()"
+)
+event.listen(User.__table__, "after_create", DDL(TOUCH_UPDATED_AT_FUNCTION).execute_if(dialect="postgresql"))
+event.listen(User.__table__, "after_create", DDL(TOUCH_UPDATED_AT_TRIGGER).execute_if(dialect="postgresql"))
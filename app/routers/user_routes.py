@@ -19,28 +19,43 @@ Key Highlights:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 import logging
 
-from app.database import get_db
-from app.schemas.user_schemas import UserCreate, UserResponse, UserUpdate, TokenResponse
+from app.schemas.token_schema import TokenResponse
+from app.schemas.user_schemas import UserCreate, UserResponse, UserUpdate
 from app.services.user_service import UserService
 from app.services.email_service import EmailService
-from app.dependencies import get_current_user, require_role, get_email_service
-from app.core.security import create_access_token
-from app.core.config import settings
-from app.utils.links import create_user_links
-from app.models.user_model import UserRole
-from app.models.audit_log_model import AuditLog
+from app.dependencies import get_db, get_current_user, get_settings, require_role, get_email_service
+from app.services.jwt_service import create_access_token
+from app.utils.link_generation import create_user_links
+from app.models.user_model import User, UserRole
+from app.models.audit_log_model import AuditActionCode
+from app.services.audit_log_writer import audit_queue
+from app.utils.uuid_gen import uuid7
 
 router = APIRouter()
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+_VALID_ROLES = frozenset(role.value for role in UserRole)
+_ROLE_BY_NAME = {role.name: role for role in UserRole}
+# Columns that UserResponse exposes, resolved once at import
+_USER_COLUMNS = tuple(c.key for c in User.__mapper__.column_attrs if c.key in UserResponse.model_fields)
+_extract_user_columns = attrgetter(*_USER_COLUMNS)  # Reads every column in one C-level call
 
-@router.post("/signup", response_model=UserResponse, tags=["Authentication"])
+
+def _user_to_dict(user: User) -> dict:
+    return dict(zip(_USER_COLUMNS, _extract_user_columns(user)))
+
+
+@router.post("/signup", response_model=UserResponse, response_class=ORJSONResponse, tags=["Authentication"])
 async def signup_user(
     user_data: UserCreate,
     request: Request,
@@ -50,96 +65,86 @@ async def signup_user(
     user = await UserService.create_user(db, user_data)
     await email_service.send_registration_email(user.email, user.first_name)
     return UserResponse.model_construct(
-        **user.dict(),
+        **_user_to_dict(user),
         links=create_user_links(user.id, request)
     )
 
 
-@router.post("/login", response_model=TokenResponse, tags=["Authentication"])
+@router.post("/login", response_model=TokenResponse, response_class=ORJSONResponse, tags=["Authentication"])
 async def login_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db)
 ):
-    user = await UserService.authenticate_user(db, form_data.username, form_data.password)
+    user = await UserService.login_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(status_code=400, detail="Invalid credentials")
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": str(user.id)}, expires_delta=access_token_expires)
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(data={"sub": str(user.id), "role": user.role.name}, expires_delta=access_token_expires)
 
     return TokenResponse(access_token=access_token, token_type="bearer")
 
 
-@router.get("/me", response_model=UserResponse, tags=["User Profile"])
+@router.get("/me", response_model=UserResponse, response_class=ORJSONResponse, tags=["User Profile"])
 async def get_profile(
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
     return UserResponse.model_construct(
         **current_user,
-        links=create_user_links(UUID(current_user["id"]), request)
+        links=create_user_links(UUID(current_user["user_id"]), request)
     )
 
 
-@router.put("/me", response_model=UserResponse, tags=["User Profile"])
+@router.put("/me", response_model=UserResponse, response_class=ORJSONResponse, tags=["User Profile"])
 async def update_profile(
     updated_data: UserUpdate,
     request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    updated_user = await UserService.update_user(db, UUID(current_user["id"]), updated_data)
+    updated_user = await UserService.update_user(db, UUID(current_user["user_id"]), updated_data)
     return UserResponse.model_construct(
-        **updated_user.dict(),
+        **_user_to_dict(updated_user),
         links=create_user_links(updated_user.id, request)
     )
 
 
-@router.put("/users/{user_id}/role", response_model=UserResponse, tags=["User Management Requires (Admin Role)"])
+@router.put("/users/{user_id}/role", response_model=UserResponse, response_class=ORJSONResponse, tags=["User Management Requires (Admin Role)"])
 async def change_user_role(
     user_id: UUID,
     new_role: str,
     request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(require_role(["ADMIN"]))
+    current_user: dict = Depends(require_role(("ADMIN",)))
 ):
     """
     Change a user's role.
     Only admins can perform this action.
-    Logs the action in the audit_logs table.
+    The audit_logs entry is queued and written in batches by the audit log writer.
     """
-    if new_role not in [role.value for role in UserRole]:
+    if new_role not in _VALID_ROLES:
         raise HTTPException(status_code=400, detail="Invalid role")
 
-    user = await UserService.get_by_id(db, user_id)
+    # One UPDATE ... RETURNING round-trip instead of SELECT then UPDATE
+    stmt = update(User).where(User.id == user_id).values(role=_ROLE_BY_NAME[new_role]).returning(User)
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-
-    user.role = UserRole[new_role]
-
-    audit_log = AuditLog(
-        action=f"Changed role to {new_role}",
-        user_id=user_id,
-        performed_by=UUID(current_user["id"])
-    )
-    db.add(user)
-    db.add(audit_log)
+    # Built before the commit so a malformed entry fails the request instead of leaving an unaudited change
+    audit_entry = {
+        "id": uuid7(),  # Assigned up front so a retried flush cannot write the entry twice
+        "action_id": AuditActionCode.CHANGE_ROLE,
+        "detail": {"role": new_role},
+        "user_id": user_id,
+        "performed_by": UUID(current_user["user_id"]),
+        "created_at": datetime.now(timezone.utc),
+    }
     await db.commit()
+    await audit_queue.put(audit_entry)
 
     return UserResponse.model_construct(
-        id=user.id,
-        nickname=user.nickname,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        bio=user.bio,
-        profile_picture_url=user.profile_picture_url,
-        linkedin_profile_url=user.linkedin_profile_url,
-        github_profile_url=user.github_profile_url,
-        role=user.role,
-        is_professional=user.is_professional,
-        last_login_at=user.last_login_at,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
+        **_user_to_dict(user),
         links=create_user_links(user.id, request)
     )
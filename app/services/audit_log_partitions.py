@@ -0,0 +1,116 @@
+# app/services/audit_log_partitions.py
+from builtins import Exception, getattr, int, range
+import asyncio
+from datetime import date, datetime, timezone
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from app.database import Database
+import logging
+
+logger = logging.getLogger(__name__)
+
+MONTHS_AHEAD = 2  # Partitions exist for the current month and this many after it
+CHECK_INTERVAL_S = 24 * 60 * 60  # The maintenance task re-checks once a day
+RETRY_INTERVAL_S = 60 * 60  # ...or hourly while the last run failed
+
+DUPLICATE_TABLE = "42P07"  # SQLSTATE for CREATE TABLE on a name that is already taken
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+class PartitionMaintenanceError(Exception):
+    """Raised when one or more monthly audit_logs partitions could not be created."""
+
+
+def _add_months(month: date, count: int) -> date:
+    years, month_index = divmod(month.month - 1 + count, 12)
+    return month.replace(year=month.year + years, month=month_index + 1, day=1)
+
+
+def _partition_name(month: date) -> str:
+    return f"audit_logs_y{month:%Y}m{month:%m}"
+
+
+async def _create_partition(session, month: date) -> bool:
+    """
+    Create the partition for one month, moving that month's rows out of audit_logs_default first;
+    attaching a range the default partition already holds rows for would otherwise be rejected.
+    Returns False if the partition already existed.
+    """
+    # Serializes maintenance across workers and replicas until this transaction ends
+    await session.execute(text("SELECT pg_advisory_xact_lock(hashtext('audit_logs_partitions'))"))
+    name = _partition_name(month)
+    if (await session.execute(text("SELECT to_regclass(:name)"), {"name": name})).scalar() is not None:
+        return False
+    start, end = f"{month} 00:00:00+00", f"{_add_months(month, 1)} 00:00:00+00"
+    in_range = f"created_at >= '{start}' AND created_at < '{end}'"
+    await session.execute(text(f"CREATE TABLE {name} (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    # Hold off new rows for this range until the partition is attached; the move itself is a single statement
+    await session.execute(text("LOCK TABLE audit_logs_default IN SHARE ROW EXCLUSIVE MODE"))
+    await session.execute(text(
+        f"WITH moved AS (DELETE FROM audit_logs_default WHERE {in_range} RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ))
+    await session.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"))
+    return True
+
+
+def _already_exists(error: SQLAlchemyError) -> bool:
+    return getattr(getattr(error, "orig", None), "sqlstate", None) == DUPLICATE_TABLE
+
+
+async def ensure_partitions(months_ahead: int = MONTHS_AHEAD) -> None:
+    """
+    Create the monthly audit_logs partitions for the current month and the next few, if missing.
+    Each month is created in its own transaction; PartitionMaintenanceError lists every month that failed.
+    """
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    failed = []
+    session_factory = Database.get_session_factory()
+    async with session_factory() as session:
+        for offset in range(months_ahead + 1):
+            month = _add_months(current, offset)
+            try:
+                if await _create_partition(session, month):
+                    logger.info(f"Created audit_logs partition {_partition_name(month)}.")
+                await session.commit()
+            except SQLAlchemyError as e:
+                await session.rollback()
+                if _already_exists(e):
+                    continue  # Another worker created it first, which is what we wanted
+                logger.error(f"Could not create audit_logs partition {_partition_name(month)}: {e}")
+                failed.append(f"{month:%Y-%m}")
+    if failed:
+        raise PartitionMaintenanceError(f"Missing audit_logs partitions for {', '.join(failed)}")
+
+
+async def _run() -> None:
+    delay = CHECK_INTERVAL_S
+    while True:
+        await asyncio.sleep(delay)
+        try:
+            await ensure_partitions()
+            delay = CHECK_INTERVAL_S
+        except Exception:  # Keep the task alive; the traceback is logged and the next attempt comes sooner
+            logger.exception("Scheduled audit_logs partition maintenance failed")
+            delay = RETRY_INTERVAL_S
+
+
+def start() -> None:
+    """Start the daily maintenance task; call after a first ensure_partitions() at startup."""
+    global _maintenance_task
+    if _maintenance_task is None or _maintenance_task.done():
+        _maintenance_task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    """Cancel the daily maintenance task."""
+    global _maintenance_task
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        try:
+            await _maintenance_task
+        except asyncio.CancelledError:
+            pass
+        _maintenance_task = None
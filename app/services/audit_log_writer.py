@@ -0,0 +1,179 @@
+# app/services/audit_log_writer.py
+from builtins import ConnectionError, Exception, OSError, dict, int, isinstance, len, list, min, object, range, tuple
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, SQLAlchemyError
+from app.database import Database
+from app.models.audit_log_model import AuditLog
+from app.utils.uuid_gen import uuid7
+import logging
+
+logger = logging.getLogger(__name__)
+
+BULK_SIZE = 100  # Flush as soon as this many entries are waiting
+FLUSH_MS = 100  # Otherwise flush whatever arrived within this window
+BULK_RECORDER_MAX_ROWS_PER_INSERT = 1000  # Larger batches are split across several INSERT statements
+COPY_MIN_ROWS = 50  # Below this, COPY's setup costs more than a multi-row INSERT
+QUEUE_MAX_SIZE = 10000  # A full queue makes audit_queue.put() wait, slowing writers down instead of growing memory
+RETRY_MIN_S = 0.5  # First wait before retrying a batch while the database is unreachable
+RETRY_MAX_S = 30  # Backoff cap between retries
+_COPY_COLUMNS = ("id", "action_id", "detail", "user_id", "performed_by", "created_at")
+
+audit_queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+_writer_task: Optional[asyncio.Task] = None
+_STOP = object()  # Sentinel queued by stop() so the writer drains everything before exiting
+
+
+async def _collect_batch() -> Tuple[List[dict], bool]:
+    """
+    Wait for one entry, then keep draining until BULK_SIZE entries or FLUSH_MS elapse.
+    The second element of the result is True once the shutdown sentinel has been seen.
+    """
+    first = await audit_queue.get()
+    if first is _STOP:
+        return [], True
+    rows = [first]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + FLUSH_MS / 1000
+    while len(rows) < BULK_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            row = await asyncio.wait_for(audit_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        if row is _STOP:
+            return rows, True
+        rows.append(row)
+    return rows, False
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """True when the database could not be reached, as opposed to it rejecting the rows."""
+    if isinstance(error, (OSError, ConnectionError, OperationalError, InterfaceError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+def _insert_new(rows: List[dict]):
+    """Multi-row INSERT that skips rows already written by an earlier, partially failed attempt."""
+    return postgresql.insert(AuditLog).values(rows).on_conflict_do_nothing(index_elements=["id", "created_at"])
+
+
+async def _flush_individually(rows: List[dict]) -> None:
+    session_factory = Database.get_session_factory()
+    async with session_factory() as session:
+        for row in rows:
+            try:
+                await session.execute(_insert_new([row]))
+                await session.commit()
+            except SQLAlchemyError as e:
+                if _is_connection_error(e):
+                    raise  # Retried by the writer; rows committed so far are skipped by ON CONFLICT
+                logger.error(f"Dropping audit log entry {row}: {e}")
+                await session.rollback()
+
+
+async def _insert_chunk(rows: List[dict]) -> None:
+    session_factory = Database.get_session_factory()
+    async with session_factory() as session:
+        try:
+            await session.execute(_insert_new(rows))
+            await session.commit()
+            return
+        except SQLAlchemyError as e:
+            if _is_connection_error(e):
+                raise
+            logger.error(f"Bulk audit log insert of {len(rows)} entries failed: {e}")
+            await session.rollback()
+    await _flush_individually(rows)
+
+
+def _copy_record(row: dict) -> tuple:
+    detail = row.get("detail")
+    return (
+        row.get("id") or uuid7(),
+        int(row["action_id"]),
+        json.dumps(detail) if detail is not None else None,  # asyncpg's COPY expects jsonb as text
+        row["user_id"],
+        row["performed_by"],
+        row.get("created_at") or datetime.now(timezone.utc),
+    )
+
+
+async def _copy_chunk(rows: List[dict]) -> bool:
+    """Stream rows with COPY over the raw asyncpg connection; returns False if the caller should INSERT instead."""
+    session_factory = Database.get_session_factory()
+    async with session_factory() as session:
+        try:
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "audit_logs", records=[_copy_record(row) for row in rows], columns=list(_COPY_COLUMNS)
+            )
+            await session.commit()
+            return True
+        except Exception as e:  # COPY has no ON CONFLICT, so e.g. a retried duplicate lands here
+            if _is_connection_error(e):
+                raise
+            logger.error(f"COPY of {len(rows)} audit log entries failed, falling back to INSERT: {e}")
+            await session.rollback()
+            return False
+
+
+async def _flush_chunk(rows: List[dict]) -> None:
+    if len(rows) >= COPY_MIN_ROWS and await _copy_chunk(rows):
+        return
+    await _insert_chunk(rows)
+
+
+async def flush(rows: List[dict]) -> None:
+    """
+    Write audit log entries in chunks of at most BULK_RECORDER_MAX_ROWS_PER_INSERT rows.
+    Chunks of COPY_MIN_ROWS or more are sent with COPY, smaller ones with a multi-row INSERT.
+    """
+    for start_index in range(0, len(rows), BULK_RECORDER_MAX_ROWS_PER_INSERT):
+        await _flush_chunk(rows[start_index:start_index + BULK_RECORDER_MAX_ROWS_PER_INSERT])
+
+
+async def _flush_with_retry(rows: List[dict]) -> None:
+    """Flush a batch, retrying with backoff for as long as the database is unreachable."""
+    delay = RETRY_MIN_S
+    while True:
+        try:
+            await flush(rows)
+            return
+        except Exception as e:  # Keep the writer alive no matter what a single batch does
+            if not _is_connection_error(e):
+                logger.error(f"Audit log writer failed to flush {len(rows)} entries: {e}")
+                return
+            logger.warning(f"Database unreachable, retrying {len(rows)} audit log entries in {delay}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RETRY_MAX_S)
+
+
+async def _run() -> None:
+    stopping = False
+    while not stopping:
+        rows, stopping = await _collect_batch()
+        await _flush_with_retry(rows)
+
+
+def start() -> None:
+    """Start the background writer task; call once the database is initialized."""
+    global _writer_task
+    if _writer_task is None or _writer_task.done():
+        _writer_task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    """Flush every queued entry and stop the background writer."""
+    global _writer_task
+    if _writer_task is not None:
+        await audit_queue.put(_STOP)
+        await _writer_task
+        _writer_task = None
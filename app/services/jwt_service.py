@@ -1,15 +1,34 @@
 # app/services/jwt_service.py
 from builtins import dict, str
+import base64
+import calendar
+import hashlib
+import hmac
+import json
 import jwt
 from datetime import datetime, timedelta
 from settings.config import settings
 
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# The HS256 header never changes, so it is serialized and encoded once at import
+_HS256_HEADER_B64 = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+def _encode_hs256(payload: dict) -> str:
+    signing_input = _HS256_HEADER_B64 + b"." + _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    signature = hmac.new(settings.jwt_secret_key.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
 def create_access_token(*, data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     # Convert role to uppercase before encoding the JWT
     if 'role' in to_encode:
         to_encode['role'] = to_encode['role'].upper()
     expire = datetime.utcnow() + (expires_delta if expires_delta else timedelta(minutes=settings.access_token_expire_minutes))
+    if settings.jwt_algorithm == "HS256":
+        to_encode.update({"exp": calendar.timegm(expire.utctimetuple())})
+        return _encode_hs256(to_encode)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
@@ -1,9 +1,10 @@
 from builtins import Exception, bool, classmethod, int, str
+import asyncio
 from datetime import datetime, timezone
 import secrets
 from typing import Optional, Dict, List
 from pydantic import ValidationError
-from sqlalchemy import func, null, update, select
+from sqlalchemy import bindparam, func, null, update, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies import get_email_service, get_settings
@@ -19,11 +20,18 @@ import logging
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Lookup statements are built once with bound parameters so every call hits the engine's compiled cache
+_USER_LOOKUPS = {
+    column: select(User).where(getattr(User, column) == bindparam(column))
+    for column in ("id", "nickname", "email")
+}
+_COUNT_USERS = select(func.count()).select_from(User)
+
 class UserService:
     @classmethod
-    async def _execute_query(cls, session: AsyncSession, query):
+    async def _execute_query(cls, session: AsyncSession, query, params: Optional[Dict] = None):
         try:
-            result = await session.execute(query)
+            result = await session.execute(query, params)
             await session.commit()
             return result
         except SQLAlchemyError as e:
@@ -32,22 +40,21 @@ class UserService:
             return None
 
     @classmethod
-    async def _fetch_user(cls, session: AsyncSession, **filters) -> Optional[User]:
-        query = select(User).filter_by(**filters)
-        result = await cls._execute_query(session, query)
+    async def _fetch_user(cls, session: AsyncSession, column: str, value) -> Optional[User]:
+        result = await cls._execute_query(session, _USER_LOOKUPS[column], {column: value})
         return result.scalars().first() if result else None
 
     @classmethod
     async def get_by_id(cls, session: AsyncSession, user_id: UUID) -> Optional[User]:
-        return await cls._fetch_user(session, id=user_id)
+        return await cls._fetch_user(session, "id", user_id)
 
     @classmethod
     async def get_by_nickname(cls, session: AsyncSession, nickname: str) -> Optional[User]:
-        return await cls._fetch_user(session, nickname=nickname)
+        return await cls._fetch_user(session, "nickname", nickname)
 
     @classmethod
     async def get_by_email(cls, session: AsyncSession, email: str) -> Optional[User]:
-        return await cls._fetch_user(session, email=email)
+        return await cls._fetch_user(session, "email", email)
 
     @classmethod
     async def create(cls, session: AsyncSession, user_data: Dict[str, str], email_service: EmailService) -> Optional[User]:
@@ -131,18 +138,18 @@ class UserService:
                 return None
             if user.is_locked:
                 return None
-            if verify_password(password, user.hashed_password):
+            # bcrypt is deliberately slow; keep it off the event loop
+            if await asyncio.to_thread(verify_password, password, user.hashed_password):
                 user.failed_login_attempts = 0
                 user.last_login_at = datetime.now(timezone.utc)
                 session.add(user)
                 await session.commit()
                 return user
             else:
-                user.failed_login_attempts += 1
-                if user.failed_login_attempts >= settings.max_login_attempts:
-                    user.is_locked = True
-                session.add(user)
+                attempts, is_locked = await User.increment_failed(session, user.id, settings.max_login_attempts)
                 await session.commit()
+                if is_locked:
+                    logger.warning(f"User {user.id} is locked after {attempts} failed login attempts.")
         return None
 
     @classmethod
@@ -184,8 +191,7 @@ class UserService:
         :param session: The AsyncSession instance for database access.
         :return: The count of users.
         """
-        query = select(func.count()).select_from(User)
-        result = await session.execute(query)
+        result = await session.execute(_COUNT_USERS)
         count = result.scalar()
         return count
     
@@ -1,9 +1,11 @@
-from builtins import dict, int, max, str
-from typing import List, Callable
+from builtins import dict, getattr, int, max, set, str
+from string import Template
+from typing import Dict, Iterable, Iterator, List, Optional, Callable
 from urllib.parse import urlencode
 from uuid import UUID
 
 from fastapi import Request
+from starlette.routing import NoMatchFound
 from app.schemas.link_schema import Link
 from app.schemas.pagination_schema import PaginationLink
 
@@ -16,19 +18,48 @@ def create_pagination_link(rel: str, base_url: str, params: dict) -> PaginationL
     query_string = f"skip={params['skip']}&limit={params['limit']}"
     return PaginationLink(rel=rel, href=f"{base_url}?{query_string}")
 
+_USER_LINK_ACTIONS = (
+    ("self", "get_user", "GET", "view"),
+    ("update", "update_user", "PUT", "update"),
+    ("delete", "delete_user", "DELETE", "delete")
+)
+# Route name -> href template, filled once at startup by compile_user_link_templates();
+# None until then, in which case links are resolved per call with request.url_for
+_user_link_templates: Optional[Dict[str, Template]] = None
+
+def compile_user_link_templates(routes: Iterable) -> None:
+    """
+    Precompile href templates for the user link routes so building links needs no route lookup.
+    Only routes whose sole path parameter is user_id get a template; actions without one are not linked.
+    """
+    global _user_link_templates
+    names = {action for _, action, _, _ in _USER_LINK_ACTIONS}
+    templates = {}
+    for route in routes:
+        name = getattr(route, "name", None)
+        if name in names and set(getattr(route, "param_convertors", {})) == {"user_id"}:
+            templates[name] = Template("${base}" + route.path_format.replace("{user_id}", "${user_id}"))
+    _user_link_templates = templates
+
+def _resolve_user_links(base: str, user_id: str, request: Request) -> Iterator[Link]:
+    for rel, action, method, action_desc in _USER_LINK_ACTIONS:
+        if _user_link_templates is not None:
+            template = _user_link_templates.get(action)
+            if template is None:
+                continue
+            href = template.substitute(base=base, user_id=user_id)
+        else:
+            try:
+                href = str(request.url_for(action, user_id=user_id))
+            except NoMatchFound:
+                continue
+        yield create_link(rel, href, method, action_desc)
+
 def create_user_links(user_id: UUID, request: Request) -> List[Link]:
     """
-    Generate navigation links for user actions.
+    Generate navigation links for user actions, skipping actions the app has no user_id route for.
     """
-    actions = [
-        ("self", "get_user", "GET", "view"),
-        ("update", "update_user", "PUT", "update"),
-        ("delete", "delete_user", "DELETE", "delete")
-    ]
-    return [
-        create_link(rel, str(request.url_for(action, user_id=str(user_id))), method, action_desc)
-        for rel, action, method, action_desc in actions
-    ]
+    return list(_resolve_user_links(str(request.base_url).rstrip("/"), str(user_id), request))
 
 def generate_pagination_links(request: Request, skip: int, limit: int, total_items: int) -> List[PaginationLink]:
     base_url = str(request.url)
@@ -0,0 +1,14 @@
+from builtins import int
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562): 48-bit Unix milliseconds followed by random bits."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | rand
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
@@ -81,6 +81,7 @@ async def setup_database():
         # you can comment out this line during development if you are debugging a single test
          await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
+    await Database.dispose()  # The audit log writer uses the app engine; drop connections bound to this test's loop
 
 @pytest.fixture(scope="function")
 async def db_session(setup_database):
@@ -7,13 +7,16 @@ from app.utils.nickname_gen import generate_nickname
 from app.utils.security import hash_password
 from app.services.jwt_service import decode_token  # Import your FastAPI app
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
+from app.models.audit_log_model import AuditActionCode, AuditLog
+from app.services import audit_log_writer
 from app.schemas.user_schemas import UserUpdate
 
-# Example of a test function using the async_client fixture
 @pytest.mark.asyncio
-async def test_change_user_role(client: TestClient, async_session: AsyncSession, admin_token):
+async def test_change_user_role(async_client, db_session, admin_user, admin_token):
+    """The role change is committed and an audit entry naming the acting admin is queued and written."""
     user_id = uuid4()
     user = User(
         id=user_id,
@@ -23,21 +26,28 @@ async def test_change_user_role(client: TestClient, async_session: AsyncSession,
         email_verified=True,
         role=UserRole.AUTHENTICATED
     )
-    async_session.add(user)
-    await async_session.commit()
-    
-    response = client.put(
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await async_client.put(
         f"/users/{user_id}/role",
-        json="MANAGER",
+        params={"new_role": "MANAGER"},
         headers={"Authorization": f"Bearer {admin_token}"}
     )
     assert response.status_code == 200
     assert response.json()["role"] == "MANAGER"
-    assert "links" in response.json()
-    
-    audit_log = (await async_session.execute(select(AuditLog).filter_by(user_id=user_id))).scalars().first()
+    stored_role = (await db_session.execute(select(User.role).where(User.id == user_id))).scalar_one()
+    assert stored_role == UserRole.MANAGER
+
+    # The route only queues the entry; start and stop the writer so it is flushed before we look
+    assert audit_log_writer.audit_queue.qsize() == 1
+    audit_log_writer.start()
+    await audit_log_writer.stop()
+    audit_log = (await db_session.execute(select(AuditLog).filter_by(user_id=user_id))).scalars().first()
     assert audit_log is not None
-    assert audit_log.action == "Changed role to MANAGER"
+    assert audit_log.action_id == AuditActionCode.CHANGE_ROLE
+    assert audit_log.detail == {"role": "MANAGER"}
+    assert audit_log.performed_by == admin_user.id
 
 @pytest.mark.asyncio
 async def test_change_user_role_invalid_role(client: TestClient, async_session: AsyncSession, admin_token):
@@ -233,6 +243,16 @@ async def test_login_success(async_client, verified_user):
     assert decoded_token is not None, "Failed to decode token"
     assert decoded_token["role"] == "AUTHENTICATED", "The user role should be AUTHENTICATED"
 
+@pytest.mark.asyncio
+async def test_login_route_issues_role_token(async_client, verified_user):
+    """/login authenticates through UserService.login_user and puts the user's id and role in the token."""
+    form_data = {"username": verified_user.email, "password": "MySuperPassword$1234"}
+    response = await async_client.post("/login", data=form_data)
+    assert response.status_code == 200
+    decoded_token = decode_token(response.json()["access_token"])
+    assert decoded_token["sub"] == str(verified_user.id)
+    assert decoded_token["role"] == "AUTHENTICATED"
+
 @pytest.mark.asyncio
 async def test_login_user_not_found(async_client):
     form_data = {
@@ -0,0 +1,24 @@
+from builtins import RuntimeError
+import pytest
+from fastapi import HTTPException
+from app.dependencies import get_db
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_db_passes_endpoint_http_errors_through():
+    """An HTTPException raised by the endpoint keeps its status instead of becoming a 500."""
+    dependency = get_db()
+    await dependency.__anext__()
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency.athrow(HTTPException(status_code=404, detail="User not found"))
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "User not found"
+
+
+async def test_get_db_turns_unexpected_errors_into_500():
+    dependency = get_db()
+    await dependency.__anext__()
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency.athrow(RuntimeError("boom"))
+    assert exc_info.value.status_code == 500
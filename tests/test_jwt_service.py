@@ -0,0 +1,26 @@
+# test_jwt_service.py
+from builtins import str
+from datetime import timedelta
+from uuid import uuid4
+import jwt
+from app.services.jwt_service import create_access_token, decode_token
+from settings.config import settings
+
+def test_access_token_round_trip():
+    """Tokens signed with the precomputed HS256 header decode with PyJWT."""
+    user_id = str(uuid4())
+    token = create_access_token(data={"sub": user_id, "role": "admin"}, expires_delta=timedelta(minutes=5))
+    payload = decode_token(token)
+    assert payload["sub"] == user_id
+    assert payload["role"] == "ADMIN"
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+def test_expired_access_token_is_rejected():
+    token = create_access_token(data={"sub": str(uuid4())}, expires_delta=timedelta(minutes=-5))
+    assert decode_token(token) is None
+
+def test_tampered_access_token_is_rejected():
+    token = create_access_token(data={"sub": str(uuid4())})
+    header, payload, signature = token.split(".")
+    forged = jwt.encode({"sub": "someone-else"}, "wrong-key", algorithm=settings.jwt_algorithm).split(".")[1]
+    assert decode_token(f"{header}.{forged}.{signature}") is None
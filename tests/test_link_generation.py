@@ -1,4 +1,4 @@
-from builtins import len, max, sorted, str
+from builtins import getattr, len, max, set, sorted, str
 from unittest.mock import MagicMock
 from urllib.parse import parse_qs, urlparse, parse_qsl, urlunparse, urlencode
 from uuid import uuid4
@@ -49,3 +49,40 @@ def test_generate_pagination_links(mock_request):
     assert len(links) >= 4
     expected_self_url = "http://testserver/users?limit=5&skip=10"
     assert normalize_url(str(links[0].href)) == normalize_url(expected_self_url), "Self link should match expected URL"
+
+def test_create_user_links_from_compiled_templates(mock_request, monkeypatch):
+    """Compiled routes are linked without url_for; an action whose route takes other parameters is left out."""
+    from starlette.routing import Route
+    from app.utils import link_generation
+
+    monkeypatch.setattr(link_generation, "_user_link_templates", None)
+    endpoint = lambda request: None
+    link_generation.compile_user_link_templates([
+        Route("/users/{user_id}", endpoint, name="get_user"),
+        Route("/users/{user_id}", endpoint, methods=["PUT"], name="update_user"),
+        Route("/users/{user_id}/{reason}", endpoint, methods=["DELETE"], name="delete_user"),
+    ])
+    mock_request.base_url = "http://testserver/"
+    user_id = uuid4()
+    links = create_user_links(user_id, mock_request)
+    assert [link.rel for link in links] == ["self", "update"]
+    assert [normalize_url(str(link.href)) for link in links] == [f"http://testserver/users/{user_id}"] * 2
+    mock_request.url_for.assert_not_called()
+
+def test_create_user_links_only_for_app_routes_taking_user_id(mock_request, monkeypatch):
+    """Links built from the real route table only advertise app routes whose sole parameter is this user_id."""
+    from app.main import app
+    from app.utils import link_generation
+
+    monkeypatch.setattr(link_generation, "_user_link_templates", None)
+    link_generation.compile_user_link_templates(app.routes)
+    linkable = {
+        route.name for route in app.routes
+        if set(getattr(route, "param_convertors", {})) == {"user_id"}
+    }
+    mock_request.base_url = "http://testserver/"
+    links = create_user_links(uuid4(), mock_request)
+    assert [link.rel for link in links] == [
+        rel for rel, action, _, _ in link_generation._USER_LINK_ACTIONS if action in linkable
+    ]
+    mock_request.url_for.assert_not_called()
@@ -0,0 +1,14 @@
+from builtins import max
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.audit_log_model import AuditAction, AuditActionCode
+
+@pytest.mark.asyncio
+async def test_new_audit_action_gets_id_after_seeded_ones(db_session: AsyncSession):
+    """
+    Tests that a database built by create_all hands out ids after the seeded AuditActionCode rows.
+    """
+    action = AuditAction(name="EXPORT_DATA")
+    db_session.add(action)
+    await db_session.commit()
+    assert action.id == max(AuditActionCode) + 1
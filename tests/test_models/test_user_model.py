@@ -41,6 +41,19 @@ async def test_failed_login_attempts_increment(db_session: AsyncSession, user: U
     await db_session.refresh(user)
     assert user.failed_login_attempts == initial_attempts + 1, "Failed login attempts should increment"
 
+@pytest.mark.asyncio
+async def test_increment_failed_locks_at_threshold(db_session: AsyncSession, user: User):
+    """
+    Tests that increment_failed() counts attempts atomically and locks the account at the threshold.
+    """
+    attempts, is_locked = await User.increment_failed(db_session, user.id, threshold=2)
+    assert (attempts, is_locked) == (1, False), "First failure should only be counted"
+    attempts, is_locked = await User.increment_failed(db_session, user.id, threshold=2)
+    assert (attempts, is_locked) == (2, True), "Reaching the threshold should lock the account"
+    await db_session.commit()
+    await db_session.refresh(user)
+    assert user.failed_login_attempts == 2 and user.is_locked
+
 @pytest.mark.asyncio
 async def test_last_login_update(db_session: AsyncSession, user: User):
     """
@@ -0,0 +1,41 @@
+import asyncio
+import pytest
+from datetime import date, datetime, timezone
+from uuid import uuid4
+from sqlalchemy import text
+from app.models.audit_log_model import AuditActionCode
+from app.services import audit_log_partitions, audit_log_writer
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_add_months_rolls_over_the_year():
+    assert audit_log_partitions._add_months(date(2025, 11, 1), 2) == date(2026, 1, 1)
+
+
+async def test_ensure_partitions_moves_rows_out_of_default(db_session):
+    """Rows that landed in the default partition are moved into their month's partition when it is created."""
+    await audit_log_writer.flush([{
+        "action_id": AuditActionCode.CHANGE_ROLE,
+        "detail": {"role": "ADMIN"},
+        "user_id": uuid4(),
+        "performed_by": uuid4(),
+        "created_at": datetime.now(timezone.utc),
+    }])
+    await audit_log_partitions.ensure_partitions(months_ahead=0)
+    await audit_log_partitions.ensure_partitions(months_ahead=0)  # Already there, so nothing to do
+    partition = (await db_session.execute(text("SELECT tableoid::regclass::text FROM audit_logs"))).scalar_one()
+    current = datetime.now(timezone.utc).date()
+    assert partition == f"audit_logs_y{current:%Y}m{current:%m}"
+
+
+async def test_concurrent_ensure_partitions_both_succeed(db_session):
+    """Two workers starting together serialize on the advisory lock instead of colliding on the table name."""
+    await asyncio.gather(
+        audit_log_partitions.ensure_partitions(months_ahead=1),
+        audit_log_partitions.ensure_partitions(months_ahead=1),
+    )
+    count = (await db_session.execute(text(
+        "SELECT count(*) FROM pg_inherits WHERE inhparent = 'audit_logs'::regclass"
+    ))).scalar_one()
+    assert count == 3  # The default partition plus this month and next
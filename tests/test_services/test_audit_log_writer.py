@@ -0,0 +1,149 @@
+from builtins import ConnectionRefusedError, ValueError, len, range, sorted
+import pytest
+from uuid import uuid4
+from sqlalchemy import select
+from app.models.audit_log_model import AuditActionCode, AuditLog
+from app.services import audit_log_writer
+
+pytestmark = pytest.mark.asyncio
+
+
+def _entry():
+    return {
+        "action_id": AuditActionCode.CHANGE_ROLE,
+        "detail": {"role": "ADMIN"},
+        "user_id": uuid4(),
+        "performed_by": uuid4(),
+    }
+
+
+async def test_writer_batches_queued_entries(monkeypatch):
+    """Entries queued close together are flushed as one batch."""
+    batches = []
+
+    async def fake_flush(rows):
+        batches.append(rows)
+
+    monkeypatch.setattr(audit_log_writer, "flush", fake_flush)
+    for _ in range(3):
+        await audit_log_writer.audit_queue.put(_entry())
+    audit_log_writer.start()
+    await audit_log_writer.stop()
+    assert [len(batch) for batch in batches] == [3]
+
+
+async def test_writer_caps_batch_size(monkeypatch):
+    """A burst larger than BULK_SIZE is split across several flushes."""
+    batches = []
+
+    async def fake_flush(rows):
+        batches.append(rows)
+
+    monkeypatch.setattr(audit_log_writer, "flush", fake_flush)
+    monkeypatch.setattr(audit_log_writer, "BULK_SIZE", 2)
+    for _ in range(5):
+        await audit_log_writer.audit_queue.put(_entry())
+    audit_log_writer.start()
+    await audit_log_writer.stop()
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+async def test_writer_retries_batch_while_database_is_unreachable(monkeypatch):
+    """A connection failure keeps the batch and retries it instead of dropping the entries."""
+    attempts = []
+
+    async def flaky_flush(rows):
+        attempts.append(len(rows))
+        if len(attempts) < 3:
+            raise ConnectionRefusedError("database is down")
+
+    monkeypatch.setattr(audit_log_writer, "flush", flaky_flush)
+    monkeypatch.setattr(audit_log_writer, "RETRY_MIN_S", 0)
+    await audit_log_writer.audit_queue.put(_entry())
+    audit_log_writer.start()
+    await audit_log_writer.stop()
+    assert attempts == [1, 1, 1]
+
+
+async def test_writer_drops_batch_the_database_rejects(monkeypatch):
+    """Errors other than lost connections are logged once, not retried."""
+    attempts = []
+
+    async def failing_flush(rows):
+        attempts.append(len(rows))
+        raise ValueError("bad entry")
+
+    monkeypatch.setattr(audit_log_writer, "flush", failing_flush)
+    await audit_log_writer.audit_queue.put(_entry())
+    audit_log_writer.start()
+    await audit_log_writer.stop()
+    assert attempts == [1]
+
+
+def test_audit_queue_is_bounded():
+    assert audit_log_writer.audit_queue.maxsize == audit_log_writer.QUEUE_MAX_SIZE > 0
+
+
+async def test_flush_splits_large_batches(monkeypatch):
+    """A flush larger than the per-statement cap is split into several INSERTs."""
+    chunks = []
+
+    async def fake_flush_chunk(rows):
+        chunks.append(rows)
+
+    monkeypatch.setattr(audit_log_writer, "_flush_chunk", fake_flush_chunk)
+    monkeypatch.setattr(audit_log_writer, "BULK_RECORDER_MAX_ROWS_PER_INSERT", 2)
+    await audit_log_writer.flush([_entry() for _ in range(5)])
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+async def test_flush_chunk_chooses_copy_or_insert(monkeypatch):
+    """Large chunks go through COPY; small chunks and failed COPYs use the INSERT path."""
+    copied, inserted = [], []
+    copy_succeeds = True
+
+    async def fake_copy_chunk(rows):
+        copied.append(len(rows))
+        return copy_succeeds
+
+    async def fake_insert_chunk(rows):
+        inserted.append(len(rows))
+
+    monkeypatch.setattr(audit_log_writer, "_copy_chunk", fake_copy_chunk)
+    monkeypatch.setattr(audit_log_writer, "_insert_chunk", fake_insert_chunk)
+    small = audit_log_writer.COPY_MIN_ROWS - 1
+    large = audit_log_writer.COPY_MIN_ROWS
+    await audit_log_writer.flush([_entry() for _ in range(small)])
+    await audit_log_writer.flush([_entry() for _ in range(large)])
+    copy_succeeds = False
+    await audit_log_writer.flush([_entry() for _ in range(large)])
+    assert copied == [large, large]
+    assert inserted == [small, large]
+
+
+async def test_flush_writes_rows_to_database(db_session):
+    """A flushed batch is stored with its action id and detail."""
+    rows = [_entry() for _ in range(3)]
+    await audit_log_writer.flush(rows)
+    stored = (await db_session.execute(select(AuditLog))).scalars().all()
+    assert sorted(log.user_id for log in stored) == sorted(row["user_id"] for row in rows)
+    assert all(log.action_id == AuditActionCode.CHANGE_ROLE for log in stored)
+    assert all(log.detail == {"role": "ADMIN"} for log in stored)
+
+
+async def test_flush_falls_back_to_single_rows_on_bad_entry(db_session):
+    """When the multi-row INSERT fails, the good entries are still written one by one and the bad one is dropped."""
+    good = [_entry(), _entry()]
+    bad = {**_entry(), "action_id": 999}  # No such audit_actions row, so the foreign key rejects it
+    await audit_log_writer.flush([good[0], bad, good[1]])
+    stored = (await db_session.execute(select(AuditLog))).scalars().all()
+    assert sorted(log.user_id for log in stored) == sorted(row["user_id"] for row in good)
+
+
+async def test_flush_copies_large_batches_to_database(db_session):
+    """A chunk of COPY_MIN_ROWS entries is written through COPY and reads back intact."""
+    rows = [_entry() for _ in range(audit_log_writer.COPY_MIN_ROWS)]
+    await audit_log_writer.flush(rows)
+    stored = (await db_session.execute(select(AuditLog))).scalars().all()
+    assert len(stored) == len(rows)
+    assert all(log.detail == {"role": "ADMIN"} for log in stored)
@@ -0,0 +1,17 @@
+from builtins import range, sorted
+import time
+from app.utils.uuid_gen import uuid7
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_time_ordered():
+    values = []
+    for _ in range(3):
+        values.append(uuid7())
+        time.sleep(0.002)
+    assert values == sorted(values)